@@ -20,8 +20,13 @@ PDFファイルをダウンロードする(Step 2)ための統合ツールです
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import csv
+import re
+from collections import namedtuple
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 import time
 import os
@@ -29,7 +34,16 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import shutil
+
+try:
+    # 任意: インストールされていればHTMLページの応答をローカルにキャッシュする
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # ==========================================
 # 定数・設定
@@ -42,6 +56,12 @@ else:
     # スクリプト実行時: スクリプトと同じディレクトリ
     CONFIG_FILE = os.path.join(os.path.dirname(__file__), "pmda_config.json")
 
+# HTTPキャッシュ（requests-cache導入時のみ使用）
+HTTP_CACHE_FILE = os.path.join(os.path.dirname(CONFIG_FILE), "pmda_cache.sqlite")
+HTTP_CACHE_EXPIRE = 3600
+# 期限切れでも条件付きGET(ETag/Last-Modified)に使えるため、削除はこの日数より古い応答のみに限る
+HTTP_CACHE_PURGE_DAYS = 30
+
 # デフォルト設定値
 DEFAULT_SETTINGS = {
     "base_url": "https://www.info.pmda.go.jp/ysearch/tenpulist.jsp?DATE=",
@@ -50,6 +70,7 @@ DEFAULT_SETTINGS = {
     "default_wait_time": 0.5,
     "scrape_wait_time": 0.3,
     "approval_number_wait_time": 0.5,
+    "download_workers": 4,
     "window_width": 700,
     "window_height": 680,
     "window_x": None,
@@ -59,18 +80,41 @@ DEFAULT_SETTINGS = {
 # HTTP設定
 HTTP_TIMEOUT = 30
 HTTP_DOWNLOAD_TIMEOUT = 60
-HTTP_CHUNK_SIZE = 8192
+HTTP_CHUNK_SIZE = 64 * 1024
 DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUS = [429, 502, 503, 504]
+HTTP_RETRY_METHODS = ['GET']
+# PDFダウンロードは1件の失敗でバッチ全体の再実行になるため、より広い範囲で再試行する
+# （待機時間は 1秒, 2秒, 4秒 と倍々に延ばし、3回失敗したら諦める）
+HTTP_DOWNLOAD_RETRY_BACKOFF = 1.0
+HTTP_DOWNLOAD_RETRY_STATUS = [429, 500, 502, 503, 504]
+
+# 同時実行数（日付単位 / 承認番号・認証番号取得）
+SCRAPE_DATE_WORKERS = 4
+NUMBER_FETCH_WORKERS = 4
+# 一覧取得時に同時に開く接続数の上限（全ワーカーが同時に詳細ページを取得する場合の数）
+SCRAPE_POOL_MAXSIZE = SCRAPE_DATE_WORKERS * NUMBER_FETCH_WORKERS
+
+# レート制限で連続送信を許可するリクエスト数（平均間隔は待機時間設定に従う）
+RATE_LIMIT_BURST = 4
 
 # URLパス構成
 YGO_PACK_PREFIX = "ygo/pack"
 YGO_PDF_PREFIX = "ygo/pdf"
+# ダウンロード対象とするPDF_URLの形式
+PDF_URL_SCHEMES = ('http://', 'https://')
 
 # CSV設定
 CSV_ENCODING = 'utf-8-sig'
+CSV_FIELDNAMES = ('日付', '区分', '販売名', '企業名', '理由', '承認番号', '認証番号', '詳細URL', 'PDF_URL')
 
 # ファイル名設定
 PDF_EXTENSION = '.pdf'
+PART_EXTENSION = '.part'
+# ファイル名に使用できない文字を '_' に置換する変換表
+_FN_INVALID_TRANS = str.maketrans({c: '_' for c in '\\/:*?"<>|'})
 CSV_FILENAME_PREFIX = 'pmda_list_'
 CSV_FILENAME_FORMAT = '%Y%m%d_%H%M%S'
 
@@ -82,6 +126,18 @@ SECTION_DELETED = '削除'
 MIN_WAIT_TIME = 0
 MAX_WAIT_TIME = 10
 
+# 同時ダウンロード数制限
+MIN_DOWNLOAD_WORKERS = 1
+MAX_DOWNLOAD_WORKERS = 8
+
+# ログ表示設定（キューに溜まったメッセージを一定間隔でまとめて表示）
+LOG_POLL_INTERVAL_MS = 100
+LOG_BATCH_SIZE = 500
+
+# ダウンロード進捗ログの間引き（K件ごと、または一定秒数ごとに1行）
+LOG_PROGRESS_EVERY = 50
+LOG_PROGRESS_INTERVAL = 0.25
+
 # グローバル設定（アプリ起動時に読み込み）
 class Settings:
     def __init__(self):
@@ -129,194 +185,363 @@ DETAIL_BASE_URL = app_settings.detail_base_url
 DEFAULT_OUTPUT_DIR = app_settings.default_output_dir
 DEFAULT_WAIT_TIME = app_settings.default_wait_time
 
+# ==========================================
+# HTTPセッション
+# ==========================================
+class DownloadRetry(Retry):
+    """1回目の再試行から待機する Retry（待機時間は backoff_factor × 1, 2, 4...秒）
+
+    urllib3 の Retry は1回目の再試行を待たずに行うため、1回目だけ backoff_factor 秒待つようにする。
+    """
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        # 直前の失敗がリダイレクト以外のエラーで、urllib3側の待機が0秒の場合（＝1回目の再試行）
+        if not backoff and self.history and self.history[-1].redirect_location is None:
+            return float(self.backoff_factor)
+        return backoff
+
+def _create_session(pool_maxsize, cached=False, retry_backoff=HTTP_RETRY_BACKOFF,
+                    retry_status=HTTP_RETRY_STATUS, retry_cls=Retry):
+    """Keep-Alive対応のHTTPセッションを生成（同一ホストへの接続を再利用）
+
+    pool_block=True により接続数が pool_maxsize を超えないよう待ち合わせるため、
+    使い捨ての接続が作られずサーバー側の接続数も一定に保たれる。
+    """
+    if cached and requests_cache:
+        # ETag/Last-Modifiedによる条件付きGETと、有効期限内の再取得省略
+        session = requests_cache.CachedSession(HTTP_CACHE_FILE, backend='sqlite',
+                                               expire_after=HTTP_CACHE_EXPIRE, cache_control=True,
+                                               allowable_codes=(200,))
+    else:
+        session = requests.Session()
+    session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+    retry = retry_cls(total=HTTP_RETRY_TOTAL, backoff_factor=retry_backoff,
+                      status_forcelist=retry_status, allowed_methods=HTTP_RETRY_METHODS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry,
+                          pool_block=True)
+    # PDF_URLはhttp://も受け付けるため、同じ再試行・接続数制限を両方に適用する
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# 一覧・詳細ページ用（キャッシュ対象）とPDFダウンロード用（キャッシュしない）のセッション
+# PDF用は同時ダウンロード数の上限と同じ数の接続を全ワーカーで使い回す
+SESSION = _create_session(SCRAPE_POOL_MAXSIZE, cached=True)
+DOWNLOAD_SESSION = _create_session(MAX_DOWNLOAD_WORKERS, retry_backoff=HTTP_DOWNLOAD_RETRY_BACKOFF,
+                                   retry_status=HTTP_DOWNLOAD_RETRY_STATUS, retry_cls=DownloadRetry)
+
+def close_session():
+    """HTTPセッションを閉じ、プールしている接続を解放（アプリ終了時に呼び出す）"""
+    if requests_cache:
+        # requests-cacheは古い応答を自動では削除しないため、終了時に削除してファイルの肥大化を防ぐ
+        try:
+            SESSION.cache.delete(older_than=timedelta(days=HTTP_CACHE_PURGE_DAYS))
+        except Exception:
+            pass
+    SESSION.close()
+    DOWNLOAD_SESSION.close()
+
+def _get_page(url, refresh=False, rate_limiter=None):
+    """HTMLページを取得（refresh=Trueの場合はキャッシュを使わず最新を取得）
+
+    rate_limiter はサーバーへ問い合わせる場合のみ使用し、有効期限内のキャッシュから返せる場合は待機しない。
+    """
+    if requests_cache and not refresh:
+        # キャッシュに無い（または期限切れの）場合は通信せずに504が返る
+        response = SESSION.get(url, timeout=HTTP_TIMEOUT, only_if_cached=True)
+        if response.status_code != 504:
+            return response
+    if rate_limiter:
+        rate_limiter.acquire()
+    if refresh and requests_cache:
+        return SESSION.get(url, timeout=HTTP_TIMEOUT, force_refresh=True)
+    return SESSION.get(url, timeout=HTTP_TIMEOUT)
+
+
+class TokenBucket:
+    """トークンバケット方式のレート制限（スレッドセーフ）
+
+    平均して interval 秒に1回のペースを守りつつ、capacity 件までは待たずに送信できる。
+    """
+
+    def __init__(self, interval, capacity=RATE_LIMIT_BURST):
+        self.rate = 1.0 / interval if interval > 0 else 0  # 0は無制限
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel=None):
+        """トークンを1つ取得（不足している場合は補充されるまで待機）
+
+        cancel に threading.Event を渡すと、待機中にセットされた時点で即座に False を返す。
+        """
+        if not self.rate:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # 先にトークンを予約し、待機はロックの外で行う
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            if cancel is not None:
+                return not cancel.wait(wait)
+            time.sleep(wait)
+        return True
+
 # ==========================================
 # 共通ロジック (Helper Functions)
 # ==========================================
 
 
+# HTML解析で木を構築する要素（それ以外のタグは読み飛ばす）
+_LIST_PAGE_STRAINER = SoupStrainer(['h2', 'table'])
+_BODY_PAGE_STRAINER = SoupStrainer(['h3', 'div'])
+
+# 一覧取得結果の1行（CSVの列と同じ並び）
+ScrapeRecord = namedtuple('ScrapeRecord', CSV_FIELDNAMES)
+
+# 詳細ページのパス（ygo/pack/{企業ID}/{ドキュメントID}/...）
+_DETAIL_PATH_RE = re.compile(r'^/*' + re.escape(YGO_PACK_PREFIX) + r'/([^/]+)/([^/]+)')
+
+# URL変換結果のキャッシュサイズ（同じ詳細URLは日付をまたいで何度も現れる）
+URL_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def extract_detail_ids(detail_url):
+    """詳細URLから(企業ID, ドキュメントID)を抽出（該当しない場合はNone）"""
+    if not detail_url:
+        return None
+    m = _DETAIL_PATH_RE.match(detail_url.replace(app_settings.detail_base_url, ""))
+    return m.groups() if m else None
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def convert_detail_url_to_pdf(detail_url):
     """詳細URLからPDF URLを生成"""
-    if not detail_url:
+    ids = extract_detail_ids(detail_url)
+    if not ids:
         return ""
-    path = detail_url.replace(app_settings.detail_base_url, "")
-    parts = path.strip("/").split("/")
-    ygo, pack = YGO_PACK_PREFIX.split("/")
-    if len(parts) >= 4 and parts[0] == ygo and parts[1] == pack:
-        company_id = parts[2]
-        doc_id = parts[3]
-        return f"{app_settings.detail_base_url}/{YGO_PDF_PREFIX}/{company_id}_{doc_id}/"
-    return ""
+    company_id, doc_id = ids
+    return f"{app_settings.detail_base_url}/{YGO_PDF_PREFIX}/{company_id}_{doc_id}/"
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def convert_detail_url_to_body_url(detail_url):
     """詳細URLからbody URLを生成"""
-    if not detail_url:
+    ids = extract_detail_ids(detail_url)
+    if not ids:
         return ""
-    path = detail_url.replace(app_settings.detail_base_url, "")
-    parts = path.strip("/").split("/")
-    ygo, pack = YGO_PACK_PREFIX.split("/")
-    if len(parts) >= 4 and parts[0] == ygo and parts[1] == pack:
-        doc_id = parts[3]
-        return f"{detail_url.rstrip('/')}/{doc_id}?view=body"
-    return ""
-
-def fetch_approval_number(detail_url, log_callback=None):
+    return f"{detail_url.rstrip('/')}/{ids[1]}?view=body"
+
+def clear_url_caches():
+    """URL変換キャッシュをクリア（詳細ベースURLの変更時に呼び出す）"""
+    extract_detail_ids.cache_clear()
+    convert_detail_url_to_pdf.cache_clear()
+    convert_detail_url_to_body_url.cache_clear()
+
+def fetch_approval_number(detail_url, log_callback=None, rate_limiter=None):
     """詳細ページのbody URLから認証番号または承認番号を取得"""
     body_url = convert_detail_url_to_body_url(detail_url)
     if not body_url:
         return "", ""
 
     try:
-        headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(body_url, headers=headers, timeout=HTTP_TIMEOUT)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        approval_no = ""
-        certification_no = ""
-
-        # 認証番号を探す
-        cert_header = soup.find('h3', class_='section_header', string='認証番号')
-        if cert_header:
-            next_div = cert_header.find_next('div')
-            if next_div:
-                certification_no = next_div.get_text(strip=True)
-
-        # 承認番号を探す
-        approval_header = soup.find('h3', class_='section_header', string='承認番号')
-        if approval_header:
-            next_div = approval_header.find_next('div')
-            if next_div:
-                approval_no = next_div.get_text(strip=True)
-
-        return approval_no, certification_no
+        response = _get_page(body_url, rate_limiter=rate_limiter)
+        soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8',
+                             parse_only=_BODY_PAGE_STRAINER)
+
+        numbers = {'承認番号': "", '認証番号': ""}
+
+        # 見出しを1回走査し、承認番号・認証番号の直後のdivを取得
+        for header in soup.find_all('h3', class_='section_header'):
+            key = header.get_text(strip=True)
+            if key in numbers and not numbers[key]:
+                next_div = header.find_next('div')
+                if next_div:
+                    numbers[key] = next_div.get_text(strip=True)
+
+        return numbers['承認番号'], numbers['認証番号']
 
     except Exception as e:
         if log_callback:
             log_callback(f"    番号取得エラー: {e}")
         return "", ""
 
-def scrape_date(date_str, fetch_numbers=False, log_callback=None, cancel_check=None):
-    """指定日付のページをスクレイピング"""
-    url = app_settings.base_url + date_str.replace("-", "")
+def _fetch_approval_numbers(records, log_callback=None, cancel_check=None, rate_limiter=None):
+    """承認番号・認証番号を並列取得（各レコードの(承認番号, 認証番号)、中止時はNoneを返す）"""
+    def _fetch(record):
+        # 中止チェック
+        if cancel_check and not cancel_check():
+            return None
+        if log_callback:
+            log_callback(f"    番号取得中: {record.販売名[:30]}...")
+        return fetch_approval_number(record.詳細URL, log_callback, rate_limiter)
+
+    with ThreadPoolExecutor(max_workers=NUMBER_FETCH_WORKERS) as executor:
+        return list(executor.map(_fetch, records))
+
+def scrape_date(date_str, compact_date, fetch_numbers=False, log_callback=None, cancel_check=None,
+                list_rate_limiter=None, number_rate_limiter=None):
+    """指定日付のページをスクレイピング（date_str: YYYY-MM-DD, compact_date: YYYYMMDD）"""
+    url = app_settings.base_url + compact_date
+    detail_base_url = app_settings.detail_base_url
     results = []
 
     try:
-        headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 当日分の一覧は更新され得るため常に再取得
+        response = _get_page(url, refresh=(compact_date == datetime.now().strftime("%Y%m%d")),
+                             rate_limiter=list_rate_limiter)
+        soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8',
+                             parse_only=_LIST_PAGE_STRAINER)
 
-        tables = soup.find_all('table')
         current_section = None
+        number_targets = []  # 番号取得対象の行インデックス
 
-        for table in tables:
-            prev_h2 = table.find_previous('h2')
-            if prev_h2:
-                if '掲載分' in prev_h2.get_text():
+        # 見出し(h2)とテーブルを文書順に1回だけ走査し、直前の見出しで区分を判定
+        for element in soup.find_all(['h2', 'table']):
+            if element.name == 'h2':
+                heading = element.get_text()
+                if '掲載分' in heading:
                     current_section = SECTION_LISTED
-                elif '削除分' in prev_h2.get_text():
+                elif '削除分' in heading:
                     current_section = SECTION_DELETED
+                continue
 
             if current_section is None:
                 continue
 
-            rows = table.find_all('tr')
+            rows = element.find_all('tr')
             for row in rows:
                 # 中止チェック
                 if cancel_check and not cancel_check():
+                    # 番号取得は行の走査後に行うため、番号が未取得の行は返さない
+                    if number_targets:
+                        return results[:number_targets[0]]
                     return results
 
-                cells = row.find_all('td')
-                if len(cells) >= 3:
-                    name_cell = cells[0]
-                    name_link = name_cell.find('a')
-                    if name_link:
-                        product_name = name_link.get_text(strip=True)
-                        detail_url = app_settings.detail_base_url + name_link.get('href', '')
-                    else:
-                        product_name = name_cell.get_text(strip=True)
-                        detail_url = ''
-
-                    company = cells[1].get_text(strip=True)
-                    company = company.replace('製造販売／', '')
-                    reason = cells[2].get_text(strip=True)
-                    pdf_url = convert_detail_url_to_pdf(detail_url)
-
-                    approval_no = ""
-                    certification_no = ""
-                    if fetch_numbers and detail_url and current_section == SECTION_LISTED:
-                        # 中止チェック
-                        if cancel_check and not cancel_check():
-                            return results
-                        if log_callback:
-                            log_callback(f"    番号取得中: {product_name[:30]}...")
-                        approval_no, certification_no = fetch_approval_number(detail_url, log_callback)
-                        time.sleep(DEFAULT_SETTINGS["approval_number_wait_time"])
-
-                    if product_name and product_name != '販売名':
-                        results.append({
-                            '日付': date_str,
-                            '区分': current_section,
-                            '販売名': product_name,
-                            '企業名': company,
-                            '理由': reason,
-                            '承認番号': approval_no,
-                            '認証番号': certification_no,
-                            '詳細URL': detail_url,
-                            'PDF_URL': pdf_url
-                        })
+                # 先頭3列のみ使用するため、直下のtdを3つ取得した時点で探索を打ち切る
+                cells = row.find_all('td', recursive=False, limit=3)
+                if len(cells) < 3:
+                    continue
+
+                name_cell = cells[0]
+                name_link = name_cell.find('a')
+                if name_link:
+                    product_name = name_link.get_text(strip=True)
+                else:
+                    product_name = name_cell.get_text(strip=True)
+
+                # 見出し行・空行は残りの列を読まずに読み飛ばす
+                if not product_name or product_name == '販売名':
+                    continue
+
+                detail_url = detail_base_url + name_link.get('href', '') if name_link else ''
+                company = cells[1].get_text(strip=True).replace('製造販売／', '')
+                reason = cells[2].get_text(strip=True)
+                pdf_url = convert_detail_url_to_pdf(detail_url)
+
+                if fetch_numbers and detail_url and current_section == SECTION_LISTED:
+                    number_targets.append(len(results))
+                results.append(ScrapeRecord(date_str, current_section, product_name, company,
+                                            reason, "", "", detail_url, pdf_url))
+
+        if number_targets:
+            # 詳細ページへのアクセスは待ち時間が支配的なため並列に実行
+            fetched = _fetch_approval_numbers([results[i] for i in number_targets],
+                                              log_callback, cancel_check, number_rate_limiter)
+            for index, numbers in zip(number_targets, fetched):
+                if numbers is None:
+                    # 中止された場合は番号取得が完了した行までを返す
+                    return results[:index]
+                results[index] = results[index]._replace(承認番号=numbers[0], 認証番号=numbers[1])
         return results
     except Exception as e:
         if log_callback:
             log_callback(f"  エラー: {e}")
         return []
 
+
+# URL末尾のパス要素（末尾のスラッシュは無視）
+_DOC_ID_RE = re.compile(r'([^/]+)/*$')
+# 同じPDF URLが複数行・複数回の実行に現れても正規表現の評価は1回で済ませる
+DOC_ID_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=DOC_ID_CACHE_SIZE)
 def extract_doc_id_from_url(url):
     """URLからドキュメントIDを抽出"""
-    parts = url.strip("/").split("/")
-    if parts:
-        return parts[-1]
-    return None
+    m = _DOC_ID_RE.search(url)
+    return m.group(1) if m else None
+
+def build_pdf_filename(doc_id, product_name):
+    """保存用のPDFファイル名を生成（「doc_id_販売名.pdf」形式）"""
+    # 販売名を10文字程度に制限し、ファイル名に使用できない文字を置換
+    product_name_short = product_name[:10].translate(_FN_INVALID_TRANS)
+    if product_name_short:
+        return f"{doc_id}_{product_name_short}{PDF_EXTENSION}"
+    return f"{doc_id}{PDF_EXTENSION}"
 
 def download_file(url, save_path):
-    """ファイルをダウンロード"""
+    """ファイルをダウンロード（一時ファイルに書き込み、完了後に保存先へ置き換え）
+
+    (成功したか, エラーメッセージ, 再試行した回数) を返す。
+    """
+    tmp_path = save_path + PART_EXTENSION
+    retried = 0
     try:
-        headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=HTTP_DOWNLOAD_TIMEOUT, stream=True)
-        if response.status_code == 200:
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=HTTP_CHUNK_SIZE):
-                    f.write(chunk)
-            return True, None
-        else:
-            return False, f"HTTPエラー: {response.status_code}"
+        # withで確実にレスポンスを閉じ、接続をプールへ返却する
+        with DOWNLOAD_SESSION.get(url, timeout=HTTP_DOWNLOAD_TIMEOUT, stream=True) as response:
+            # 自動再試行が行われた場合は、その履歴が最終レスポンスに残っている
+            retries = getattr(response.raw, 'retries', None)
+            if retries is not None:
+                retried = len(retries.history)
+            if response.status_code != 200:
+                return False, f"HTTPエラー: {response.status_code}", retried
+            # gzip等で圧縮されている場合もraw経由で展開して書き込む
+            response.raw.decode_content = True
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, HTTP_CHUNK_SIZE)
+        # 完全に書き終えたファイルだけが保存先の名前で存在するようにする
+        os.replace(tmp_path, save_path)
+        return True, None, retried
     except Exception as e:
-        return False, str(e)
+        # 途中まで書き込んだ一時ファイルは残さない
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False, str(e), retried
 
 def load_hospital_device_list(csv_path):
-    """病院内機器リストCSVを読み込み、承認番号・認証番号のセットを返す"""
+    """病院内機器リストCSVを読み込み、承認番号・認証番号のセット(frozenset)を返す"""
     approval_numbers = set()
     certification_numbers = set()
 
-    with open(csv_path, 'r', encoding=CSV_ENCODING) as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        approval_col = None
-        certification_col = None
+    with open(csv_path, 'r', encoding=CSV_ENCODING, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
 
-        for col in fieldnames:
+        # 対象列の位置をヘッダーから一度だけ特定
+        approval_idx = None
+        certification_idx = None
+        for i, col in enumerate(header):
             if '承認番号' in col:
-                approval_col = col
+                approval_idx = i
             if '認証番号' in col:
-                certification_col = col
+                certification_idx = i
 
         for row in reader:
-            if approval_col and row.get(approval_col):
-                approval_numbers.add(row[approval_col].strip())
-            if certification_col and row.get(certification_col):
-                certification_numbers.add(row[certification_col].strip())
+            if approval_idx is not None and approval_idx < len(row):
+                value = row[approval_idx].strip()
+                if value:
+                    approval_numbers.add(value)
+            if certification_idx is not None and certification_idx < len(row):
+                value = row[certification_idx].strip()
+                if value:
+                    certification_numbers.add(value)
 
-    return approval_numbers, certification_numbers
+    return frozenset(approval_numbers), frozenset(certification_numbers)
 
 
 # ==========================================
@@ -325,26 +550,88 @@ def load_hospital_device_list(csv_path):
 class BaseTaskTab(ttk.Frame):
     """タスク実行タブの基底クラス（ログ、プログレスバー、ボタン制御の共通機能）"""
 
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        # ワーカースレッドからのログはキュー経由でGUIスレッドに渡す
+        self._log_q = queue.Queue()
+        self.after(LOG_POLL_INTERVAL_MS, self._drain_log)
+        # 中止制御用のイベント（セット済み = 停止中）
+        self._cancel = threading.Event()
+        self._cancel.set()
+
+    @property
+    def is_running(self):
+        """実行中かどうか（中止イベントがセットされていなければ実行中）"""
+        return not self._cancel.is_set()
+
+    @is_running.setter
+    def is_running(self, value):
+        if value:
+            self._cancel.clear()
+        else:
+            self._cancel.set()
+
+    def _make_log_readonly(self):
+        """ログ欄をユーザーが編集できないようにする（状態はNORMALのまま、書き込み時の切り替えを不要にする）"""
+        def block_key(event):
+            # コピー(Ctrl+C)・全選択(Ctrl+A)のみ許可
+            if event.state & 0x4 and event.keysym.lower() in ('c', 'a'):
+                return None
+            return 'break'
+
+        self.log_text.bind('<Key>', block_key)
+        for seq in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>', '<<Clear>>'):
+            self.log_text.bind(seq, lambda e: 'break')
+
     def log(self, msg):
         """ログメッセージを追加（スレッドセーフ）"""
-        def _log():
-            self.log_text.configure(state=tk.NORMAL)
-            self.log_text.insert(tk.END, msg + "\n")
-            self.log_text.see(tk.END)
-            self.log_text.configure(state=tk.DISABLED)
+        self._log_q.put_nowait(msg)
+
+    def call_in_gui(self, func, *args):
+        """GUI操作をGUIスレッドで実行するよう依頼（スレッドセーフ）
 
-        # GUIスレッドで実行
+        ログと同じキューに積むため、それまでに出力したログが表示された後に実行される。
+        """
+        self._log_q.put_nowait(partial(func, *args))
+
+    def _drain_log(self):
+        """キューに溜まったログをまとめてテキストに反映（GUIスレッドで定期実行）"""
+        lines = []
         try:
-            self.winfo_toplevel().after(0, _log)
-        except:
-            # フォールバック（初期化中などの場合）
-            _log()
+            for _ in range(LOG_BATCH_SIZE):
+                item = self._log_q.get_nowait()
+                if callable(item):
+                    # 先に積まれたログを表示してから実行（完了ダイアログがログより先に出ないようにする）
+                    self._insert_log_lines(lines)
+                    lines = []
+                    item()
+                else:
+                    lines.append(item)
+        except queue.Empty:
+            pass
+
+        self._insert_log_lines(lines)
+        self.after(LOG_POLL_INTERVAL_MS, self._drain_log)
+
+    def _insert_log_lines(self, lines):
+        """ログ欄に複数行をまとめて追加"""
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
 
     def clear_log(self):
-        """ログをクリア"""
-        self.log_text.configure(state=tk.NORMAL)
+        """ログをクリア（未表示のメッセージも破棄）"""
+        # 前回の処理の終了間際に積まれたメッセージが新しいログに混ざらないようにする
+        # （GUI操作の依頼は破棄せずに実行する）
+        try:
+            while True:
+                item = self._log_q.get_nowait()
+                if callable(item):
+                    item()
+        except queue.Empty:
+            pass
+
         self.log_text.delete(1.0, tk.END)
-        self.log_text.configure(state=tk.DISABLED)
 
     def set_running_state(self, is_running):
         """実行中の状態を設定（ボタンの有効/無効を切り替え）"""
@@ -368,7 +655,6 @@ class ScrapeTab(BaseTaskTab):
     def __init__(self, parent, app):
         super().__init__(parent, padding="10")
         self.app = app
-        self.is_running = False  # 中止制御用フラグ
 
         # 日付モード選択
         mode_frame = ttk.LabelFrame(self, text="取得モード", padding="10")
@@ -459,7 +745,8 @@ class ScrapeTab(BaseTaskTab):
         # ログ
         log_group = ttk.LabelFrame(self, text="ログ", padding="5")
         log_group.pack(fill=tk.BOTH, expand=True)
-        self.log_text = tk.Text(log_group, height=8, state=tk.DISABLED)
+        self.log_text = tk.Text(log_group, height=8, undo=False)
+        self._make_log_readonly()
         sb = ttk.Scrollbar(log_group, orient=tk.VERTICAL, command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=sb.set)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -524,13 +811,10 @@ class ScrapeTab(BaseTaskTab):
         self.cancel_task()
 
     def _generate_date_range(self, start_date, end_date):
-        """日付範囲のリストを生成"""
-        dates = []
-        cur = start_date
-        while cur <= end_date:
-            dates.append(cur.strftime("%Y-%m-%d"))
-            cur += timedelta(days=1)
-        return dates
+        """日付範囲のリストを生成（表示用のYYYY-MM-DDとURL用のYYYYMMDDの組）"""
+        days = (end_date - start_date).days + 1
+        return [(d.strftime("%Y-%m-%d"), d.strftime("%Y%m%d"))
+                for d in (start_date + timedelta(days=i) for i in range(days))]
 
     def _log_scrape_start(self, start_date, end_date, dates, fetch_nums):
         """収集開始のログを出力"""
@@ -544,43 +828,63 @@ class ScrapeTab(BaseTaskTab):
             self.log("※承認番号・認証番号も取得します（時間がかかります）")
         self.log("")
 
-    def _collect_data(self, dates, fetch_nums):
-        """データを収集"""
-        all_results = []
+    def _scrape_one_date(self, index, total, date_str, compact_date, fetch_nums):
+        """1日分のデータを収集（ワーカースレッドで実行）"""
+        if not self.is_running:
+            return []
+
+        self.log(f"[{index}/{total}] {date_str} 収集中...")
+        return scrape_date(date_str, compact_date, fetch_nums, self.log, lambda: self.is_running,
+                           self._list_rate_limiter, self._number_rate_limiter)
+
+    def _collect_data(self, dates, fetch_nums, csv_file, writer):
+        """データを収集（複数日付を並列に取得し、日付順にCSVへ逐次書き込み）"""
+        count = 0
         total = len(dates)
 
-        for i, date_str in enumerate(dates, 1):
-            if not self.is_running:
-                break
+        with ThreadPoolExecutor(max_workers=SCRAPE_DATE_WORKERS) as executor:
+            futures = [executor.submit(self._scrape_one_date, i, total, date_str, compact_date, fetch_nums)
+                       for i, (date_str, compact_date) in enumerate(dates, 1)]
 
-            self.log(f"[{i}/{total}] {date_str} 収集中...")
-            results = scrape_date(date_str, fetch_nums, self.log, lambda: self.is_running)
-            all_results.extend(results)
-            self.log(f"  → {len(results)}件取得")
+            for (date_str, _), future in zip(dates, futures):
+                if not self.is_running:
+                    # 未着手の日付はキャンセル
+                    for f in futures:
+                        f.cancel()
+                    break
 
-            time.sleep(app_settings.scrape_wait_time)
+                results = future.result()
+                # ScrapeRecordは列順どおりのタプルなのでそのまま書き込める
+                writer.writerows(results)
+                csv_file.flush()
+                count += len(results)
+                self.log(f"  → {date_str}: {len(results)}件取得")
 
-        return all_results
+        return count
 
-    def _handle_scrape_completion(self, all_results, out_dir):
+    def _handle_scrape_completion(self, count, output_path):
         """収集完了時の処理"""
+        if count == 0:
+            # 空のCSVは残さない
+            os.remove(output_path)
+
         if not self.is_running:
             self.log("")
             self.log("=== 中断されました ===")
-            if all_results:
-                self.log(f"中断までに {len(all_results)}件 取得しました")
-                if messagebox.askyesno("確認", f"{len(all_results)}件のデータを保存しますか?"):
-                    self.save_results(all_results, out_dir)
+            if count:
+                self.log(f"中断までに {count}件 取得しました")
+                self.log(f"保存完了: {output_path}")
         else:
             self.log("")
-            self.log(f"=== 収集完了: 合計 {len(all_results)}件 ===")
+            self.log(f"=== 収集完了: 合計 {count}件 ===")
 
-            if all_results:
-                output_path = self.save_results(all_results, out_dir)
-                messagebox.showinfo("完了", f"収集が完了しました。\n\n取得件数: {len(all_results)}件\n保存先: {output_path}")
-                self.app.set_download_csv_path(output_path)
+            if count:
+                self.log(f"保存完了: {output_path}")
+                self.call_in_gui(messagebox.showinfo, "完了",
+                                 f"収集が完了しました。\n\n取得件数: {count}件\n保存先: {output_path}")
+                self.call_in_gui(self.app.set_download_csv_path, output_path)
             else:
-                messagebox.showinfo("完了", "データが見つかりませんでした")
+                self.call_in_gui(messagebox.showinfo, "完了", "データが見つかりませんでした")
 
     def scrape_thread(self, start_date, end_date, out_dir, fetch_nums):
         """スクレイピング処理のメインスレッド"""
@@ -590,29 +894,30 @@ class ScrapeTab(BaseTaskTab):
             dates = self._generate_date_range(start_date, end_date)
             self._log_scrape_start(start_date, end_date, dates, fetch_nums)
 
-            all_results = self._collect_data(dates, fetch_nums)
-            self._handle_scrape_completion(all_results, out_dir)
+            # 一覧ページ・詳細ページそれぞれの平均リクエスト間隔を制限
+            self._list_rate_limiter = TokenBucket(app_settings.scrape_wait_time)
+            self._number_rate_limiter = TokenBucket(DEFAULT_SETTINGS["approval_number_wait_time"])
+
+            # 取得した行は日付ごとにCSVへ書き出す（中断・エラー時も取得済み分が残る）
+            output_path = self._create_output_path(out_dir)
+            with open(output_path, 'w', encoding=CSV_ENCODING, newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDNAMES)
+                count = self._collect_data(dates, fetch_nums, f, writer)
+
+            self._handle_scrape_completion(count, output_path)
 
         except Exception as e:
             self.log(f"エラー: {e}")
-            messagebox.showerror("エラー", str(e))
+            self.call_in_gui(messagebox.showerror, "エラー", str(e))
         finally:
             self.is_running = False
-            self.set_running_state(False)
+            self.call_in_gui(self.set_running_state, False)
 
-    def save_results(self, results, out_dir):
-        """結果をCSVに保存"""
+    def _create_output_path(self, out_dir):
+        """出力CSVのパスを生成"""
         ts = datetime.now().strftime(CSV_FILENAME_FORMAT)
-        output_path = os.path.join(out_dir, f"{CSV_FILENAME_PREFIX}{ts}.csv")
-
-        fieldnames = ['日付', '区分', '販売名', '企業名', '理由', '承認番号', '認証番号', '詳細URL', 'PDF_URL']
-        with open(output_path, 'w', encoding=CSV_ENCODING, newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-
-        self.log(f"保存完了: {output_path}")
-        return output_path
+        return os.path.join(out_dir, f"{CSV_FILENAME_PREFIX}{ts}.csv")
 
 
 # ==========================================
@@ -621,7 +926,8 @@ class ScrapeTab(BaseTaskTab):
 class DownloadTab(BaseTaskTab):
     def __init__(self, parent):
         super().__init__(parent, padding="10")
-        self.is_running = False  # 中止制御用フラグ
+        self._last_log_t = 0.0  # 最後に進捗ログを出力した時刻
+        self._last_log_done = -1  # 最後に進捗ログを出力した処理件数
 
         # CSV選択
         csv_frame = ttk.LabelFrame(self, text="Step 1で作成したCSVファイル", padding="10")
@@ -682,7 +988,8 @@ class DownloadTab(BaseTaskTab):
         # ログ
         log_group = ttk.LabelFrame(self, text="ログ", padding="5")
         log_group.pack(fill=tk.BOTH, expand=True)
-        self.log_text = tk.Text(log_group, height=8, state=tk.DISABLED)
+        self.log_text = tk.Text(log_group, height=8, undo=False)
+        self._make_log_readonly()
         sb = ttk.Scrollbar(log_group, orient=tk.VERTICAL, command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=sb.set)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -723,13 +1030,15 @@ class DownloadTab(BaseTaskTab):
             return
 
         wait = app_settings.default_wait_time
+        workers = app_settings.download_workers
 
         self.is_running = True
         self.set_running_state(True)
         self.clear_log()
 
         thread = threading.Thread(target=self.download_thread,
-                                  args=(pmda_csv, out_dir, use_filter, hosp_csv, self.skip_exist_var.get(), wait))
+                                  args=(pmda_csv, out_dir, use_filter, hosp_csv, self.skip_exist_var.get(),
+                                        wait, workers))
         thread.daemon = True
         thread.start()
 
@@ -738,8 +1047,8 @@ class DownloadTab(BaseTaskTab):
         self.cancel_task()
 
     def _load_filter_lists(self, use_filter, hosp_csv):
-        """病院リストからフィルタリング用のセットを読み込み"""
-        target_approvals, target_certs = set(), set()
+        """病院リストからフィルタリング用のセットを読み込み（読み取り専用のfrozensetで返す）"""
+        target_approvals, target_certs = frozenset(), frozenset()
         if use_filter:
             self.log("病院リスト読み込み中...")
             try:
@@ -751,105 +1060,176 @@ class DownloadTab(BaseTaskTab):
         return target_approvals, target_certs
 
     def _load_and_filter_targets(self, csv_file, use_filter, target_approvals, target_certs):
-        """CSVを読み込み、フィルタリング後の対象を返す"""
-        with open(csv_file, 'r', encoding=CSV_ENCODING) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        targets = [r for r in rows if r.get('区分') == SECTION_LISTED and r.get('PDF_URL')]
+        """CSVを読み込み、フィルタリング後の対象を (販売名, PDF_URL) のタプルのリストで返す（1パスで絞り込み）"""
+        if use_filter and not target_approvals and not target_certs:
+            # 照合対象の番号が1件も無ければ一致する行は無いため、CSVを読まずに終了
+            self.log("病院リストに承認番号・認証番号が無いため、一致する対象はありません")
+            return []
+
+        targets = []
+        total_seen = 0  # 掲載分かつPDF URLがある行の数
+
+        with open(csv_file, 'r', encoding=CSV_ENCODING, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+
+            # 対象列の位置をヘッダーから一度だけ特定
+            missing = [c for c in ('区分', '販売名', 'PDF_URL') if c not in header]
+            if missing:
+                raise ValueError(f"CSVに必要な列がありません: {', '.join(missing)}")
+            section_idx = header.index('区分')
+            name_idx = header.index('販売名')
+            url_idx = header.index('PDF_URL')
+            approval_idx = header.index('承認番号') if '承認番号' in header else None
+            certification_idx = header.index('認証番号') if '認証番号' in header else None
+
+            for row in reader:
+                # PDF_URLが空・不正な行はここで除外し、ダウンロード処理には渡さない
+                if (max(section_idx, url_idx) >= len(row) or row[section_idx] != SECTION_LISTED
+                        or not row[url_idx].startswith(PDF_URL_SCHEMES)):
+                    continue
+                total_seen += 1
+
+                if use_filter:
+                    an = row[approval_idx].strip() if approval_idx is not None and approval_idx < len(row) else ''
+                    cn = row[certification_idx].strip() if certification_idx is not None and certification_idx < len(row) else ''
+                    if not ((an and an in target_approvals) or (cn and cn in target_certs)):
+                        continue
+                targets.append((row[name_idx] if name_idx < len(row) else '', row[url_idx]))
 
         if use_filter:
-            filtered = []
-            for r in targets:
-                an = r.get('承認番号', '').strip()
-                cn = r.get('認証番号', '').strip()
-                if (an and an in target_approvals) or (cn and cn in target_certs):
-                    filtered.append(r)
-            self.log(f"全{len(targets)}件中、病院リストと一致: {len(filtered)}件")
-            targets = filtered
+            self.log(f"全{total_seen}件中、病院リストと一致: {len(targets)}件")
 
         return targets
 
-    def _download_files(self, targets, pdf_dir, skip_exist, wait_sec):
-        """ファイルを一括ダウンロード"""
-        success, fail, skipped = 0, 0, 0
-
-        for i, row in enumerate(targets, 1):
-            if not self.is_running:
-                break
+    def _download_one(self, url, save_path, rate_limiter):
+        """1件ダウンロード（ワーカースレッドで実行、中止済みの場合はNoneを返す）"""
+        if self._cancel.is_set() or not rate_limiter.acquire(self._cancel):
+            return None
+        return download_file(url, save_path)
 
-            name = row.get('販売名', '')
-            url = row.get('PDF_URL', '')
-            doc_id = extract_doc_id_from_url(url)
-
-            if not doc_id:
-                continue
-
-            # 販売名を10文字程度に制限し、ファイル名に使用できない文字を除去
-            product_name_short = name[:10]
-            # ファイル名に使用できない文字を置換
-            invalid_chars = ['\\', '/', ':', '*', '?', '"', '<', '>', '|']
-            for char in invalid_chars:
-                product_name_short = product_name_short.replace(char, '_')
-
-            # ファイル名を「doc_id_販売名.pdf」の形式にする
-            if product_name_short:
-                filename = f"{doc_id}_{product_name_short}{PDF_EXTENSION}"
-            else:
-                filename = f"{doc_id}{PDF_EXTENSION}"
-
-            save_path = os.path.join(pdf_dir, filename)
-
-            # ログ表示用には30文字に制限
-            display_name = name[:30]
-            self.log(f"[{i}/{len(targets)}] {display_name}...")
-
-            if skip_exist and os.path.exists(save_path):
-                self.log("  → スキップ(既存)")
-                skipped += 1
-            else:
-                ok, err = download_file(url, save_path)
+    def _download_files(self, targets, pdf_dir, skip_exist, wait_sec, workers):
+        """ファイルを一括ダウンロード（workers件まで並列に実行、pdf_dirは末尾に区切り文字付き）"""
+        success, fail, skipped = 0, 0, 0
+        recovered = 0  # 再試行の末に成功した件数
+        self._last_log_t = time.monotonic()
+        self._last_log_done = -1
+        # 並列数に関わらず、平均してwait_sec秒に1件のペースを守る
+        rate_limiter = TokenBucket(wait_sec)
+
+        # 既存ファイル名はディレクトリを1回走査して取得（ファイルごとのstatを避ける）
+        existing = set()
+        if skip_exist:
+            try:
+                existing = {entry.name for entry in os.scandir(pdf_dir)}
+            except FileNotFoundError:
+                pass
+
+        total = len(targets)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}  # future → [行番号, 表示名, 同じ保存先を対象とする行数]
+            submitted = {}  # 保存先パス → ダウンロード中のfuture
+            for i, (name, url) in enumerate(targets, 1):
+                if not self.is_running:
+                    break
+
+                # ログ表示用には30文字に制限（ファイル名用の10文字もここから切り出す）
+                display_name = name[:30]
+                # URLはhttp(s)://で始まることを読み込み時に確認済みのため、doc_idは必ず得られる
+                doc_id = extract_doc_id_from_url(url)
+                filename = build_pdf_filename(doc_id, display_name)
+                save_path = pdf_dir + filename
+
+                if skip_exist and filename in existing:
+                    skipped += 1
+                    self._log_progress(success + fail + skipped, total, success, fail, skipped)
+                elif save_path in submitted:
+                    # 同じ保存先の行（複数の日付に掲載された同一製品など）は1回だけダウンロードし、
+                    # 同じ一時ファイルへの同時書き込みを避ける。結果は最初の行と同じものとして集計する
+                    futures[submitted[save_path]][2] += 1
+                else:
+                    future = executor.submit(self._download_one, url, save_path, rate_limiter)
+                    futures[future] = [i, display_name, 1]
+                    submitted[save_path] = future
+
+            # 完了した順に結果を集計
+            pending_cancelled = False
+            for future in as_completed(futures):
+                if not pending_cancelled and not self.is_running:
+                    # 未着手のダウンロードはキャンセル（全futureの走査は1回だけ行う）
+                    for f in futures:
+                        f.cancel()
+                    pending_cancelled = True
+                if future.cancelled():
+                    continue
+                result = future.result()
+                if result is None:
+                    continue
+
+                ok, err, retried = result
+                i, display_name, count = futures[future]
                 if ok:
-                    self.log("  → 完了")
-                    success += 1
+                    success += count
+                    if retried:
+                        recovered += count
                 else:
+                    # 失敗は間引かずに個別に表示
+                    self.log(f"[{i}/{total}] {display_name}...")
                     self.log(f"  → 失敗: {err}")
-                    fail += 1
-                time.sleep(wait_sec)
+                    fail += count
+                self._log_progress(success + fail + skipped, total, success, fail, skipped)
 
-        return success, fail, skipped
+        self._log_progress(success + fail + skipped, total, success, fail, skipped, force=True)
+        return success, fail, skipped, recovered
 
-    def _handle_download_completion(self, success, fail, skipped):
+    def _log_progress(self, done, total, success, fail, skipped, force=False):
+        """進捗をログ出力（LOG_PROGRESS_EVERY件ごと、またはLOG_PROGRESS_INTERVAL秒ごとに間引く）"""
+        now = time.monotonic()
+        if done == self._last_log_done:
+            return
+        if (force or done == total or done % LOG_PROGRESS_EVERY == 0
+                or now - self._last_log_t >= LOG_PROGRESS_INTERVAL):
+            self._last_log_t = now
+            self._last_log_done = done
+            self.log(f"[{done}/{total}] 成功: {success} / スキップ: {skipped} / 失敗: {fail}")
+
+    def _handle_download_completion(self, success, fail, skipped, recovered):
         """ダウンロード完了時の処理"""
         if not self.is_running:
             self.log("")
             self.log("=== 中断されました ===")
-            self.log(f"成功: {success} / スキップ: {skipped} / 失敗: {fail}")
+            self.log(f"成功: {success} (うち再試行で成功: {recovered}) / スキップ: {skipped} / 失敗: {fail}")
         else:
             self.log("")
             self.log("=== 全処理完了 ===")
-            messagebox.showinfo("完了", f"ダウンロードが完了しました。\n\n成功: {success}\nスキップ: {skipped}\n失敗: {fail}")
+            self.log(f"成功: {success} (うち再試行で成功: {recovered}) / スキップ: {skipped} / 失敗: {fail}")
+            self.call_in_gui(messagebox.showinfo, "完了",
+                             f"ダウンロードが完了しました。\n\n成功: {success} (うち再試行で成功: {recovered})\n"
+                             f"スキップ: {skipped}\n失敗: {fail}")
 
-    def download_thread(self, csv_file, out_dir, use_filter, hosp_csv, skip_exist, wait_sec):
+    def download_thread(self, csv_file, out_dir, use_filter, hosp_csv, skip_exist, wait_sec, workers):
         """ダウンロード処理のメインスレッド"""
         try:
             pdf_dir = os.path.join(out_dir, "pdf")
             os.makedirs(pdf_dir, exist_ok=True)
+            # 末尾に区切り文字を付けておき、各ファイルのパスは連結のみで組み立てる
+            pdf_dir = os.path.join(pdf_dir, "")
 
             target_approvals, target_certs = self._load_filter_lists(use_filter, hosp_csv)
             targets = self._load_and_filter_targets(csv_file, use_filter, target_approvals, target_certs)
 
             self.log(f"--- ダウンロード開始 (対象: {len(targets)}件) ---")
 
-            success, fail, skipped = self._download_files(targets, pdf_dir, skip_exist, wait_sec)
-            self._handle_download_completion(success, fail, skipped)
+            success, fail, skipped, recovered = self._download_files(targets, pdf_dir, skip_exist, wait_sec, workers)
+            self._handle_download_completion(success, fail, skipped, recovered)
 
         except Exception as e:
             self.log(f"エラー: {e}")
-            messagebox.showerror("エラー", str(e))
+            self.call_in_gui(messagebox.showerror, "エラー", str(e))
         finally:
             self.is_running = False
-            self.set_running_state(False)
+            self.call_in_gui(self.set_running_state, False)
 
 
 # ==========================================
@@ -896,6 +1276,14 @@ class SettingsTab(ttk.Frame):
         ttk.Entry(scrape_wait_frame, textvariable=self.scrape_wait_var, width=10).pack(side=tk.LEFT, padx=(5, 5))
         ttk.Label(scrape_wait_frame, text="※日付間の待機時間", foreground="gray").pack(side=tk.LEFT)
 
+        # 同時ダウンロード数
+        workers_frame = ttk.Frame(basic_frame)
+        workers_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(workers_frame, text="同時ダウンロード数:", width=25).pack(side=tk.LEFT)
+        self.download_workers_var = tk.StringVar(value=str(app_settings.download_workers))
+        ttk.Entry(workers_frame, textvariable=self.download_workers_var, width=10).pack(side=tk.LEFT, padx=(5, 5))
+        ttk.Label(workers_frame, text="※並列でダウンロードするファイル数", foreground="gray").pack(side=tk.LEFT)
+
         # 詳細設定（上級者向け）
         advanced_frame = ttk.LabelFrame(self, text="詳細設定（上級者向け）", padding="10")
         advanced_frame.pack(fill=tk.X, pady=(0, 10))
@@ -944,13 +1332,25 @@ class SettingsTab(ttk.Frame):
             if scrape_wait < MIN_WAIT_TIME or scrape_wait > MAX_WAIT_TIME:
                 messagebox.showerror("エラー", f"一覧取得待機時間は{MIN_WAIT_TIME}～{MAX_WAIT_TIME}秒の範囲で指定してください")
                 return
+
+            try:
+                workers = int(self.download_workers_var.get())
+            except ValueError:
+                messagebox.showerror("エラー", "同時ダウンロード数は整数で入力してください")
+                return
+
+            if workers < MIN_DOWNLOAD_WORKERS or workers > MAX_DOWNLOAD_WORKERS:
+                messagebox.showerror("エラー", f"同時ダウンロード数は{MIN_DOWNLOAD_WORKERS}～{MAX_DOWNLOAD_WORKERS}の範囲で指定してください")
+                return
             
             # 設定を更新
             app_settings.default_output_dir = self.output_dir_var.get()
             app_settings.default_wait_time = wait_time
             app_settings.scrape_wait_time = scrape_wait
+            app_settings.download_workers = workers
             app_settings.base_url = self.base_url_var.get()
             app_settings.detail_base_url = self.detail_url_var.get()
+            clear_url_caches()
             
             # ファイルに保存
             app_settings.save()
@@ -970,11 +1370,13 @@ class SettingsTab(ttk.Frame):
         if messagebox.askyesno("確認", "すべての設定をデフォルト値に戻しますか？"):
             app_settings.reset()
             app_settings.save()
+            clear_url_caches()
 
             # 設定タブのUIを更新
             self.output_dir_var.set(app_settings.default_output_dir)
             self.wait_time_var.set(str(app_settings.default_wait_time))
             self.scrape_wait_var.set(str(app_settings.scrape_wait_time))
+            self.download_workers_var.set(str(app_settings.download_workers))
             self.base_url_var.set(app_settings.base_url)
             self.detail_url_var.set(app_settings.detail_base_url)
 
@@ -1085,6 +1487,9 @@ class PMDAToolApp:
         # ウィンドウサイズと位置を保存
         self.save_window_geometry()
 
+        # 保持している接続を解放
+        close_session()
+
         # ウィンドウを閉じる
         self.root.destroy()
 